@@ -0,0 +1,8 @@
+"""
+Cache for E-Commerce Recommendation System
+Shared Flask-Caching instance, bound to the app in create_app
+"""
+
+from flask_caching import Cache
+
+cache = Cache()
@@ -3,9 +3,9 @@ Error Handlers for E-Commerce Recommendation System
 Centralized error handling for consistent API responses
 """
 
-from flask import jsonify
 from werkzeug.exceptions import HTTPException
 from validators.validators import ValidationError
+from utils.helpers import json_dumps, json_response
 from config.constants import (
     HTTP_BAD_REQUEST, HTTP_NOT_FOUND, HTTP_INTERNAL_ERROR
 )
@@ -21,57 +21,58 @@ def register_error_handlers(app):
     Args:
         app: Flask application instance
     """
+    # Static error bodies, encoded once at registration
+    not_found_body = json_dumps({
+        'error': 'Not Found',
+        'message': 'The requested resource was not found'
+    })
+    bad_request_body = json_dumps({
+        'error': 'Bad Request',
+        'message': 'The request could not be understood or was missing required parameters'
+    })
+    internal_error_body = json_dumps({
+        'error': 'Internal Server Error',
+        'message': 'An unexpected error occurred. Please try again later.'
+    })
     
     @app.errorhandler(ValidationError)
     def handle_validation_error(error):
         """Handle validation errors"""
-        logger.warning(f"Validation error: {str(error)}")
-        return jsonify({
+        logger.warning("Validation error: %s", error)
+        return json_response({
             'error': 'Validation Error',
             'message': str(error)
-        }), HTTP_BAD_REQUEST
+        }, HTTP_BAD_REQUEST)
     
     @app.errorhandler(404)
     def handle_not_found(error):
         """Handle 404 Not Found errors"""
-        logger.info(f"Not found: {error}")
-        return jsonify({
-            'error': 'Not Found',
-            'message': 'The requested resource was not found'
-        }), HTTP_NOT_FOUND
+        logger.info("Not found: %s", error)
+        return json_response(not_found_body, HTTP_NOT_FOUND)
     
     @app.errorhandler(400)
     def handle_bad_request(error):
         """Handle 400 Bad Request errors"""
-        logger.warning(f"Bad request: {error}")
-        return jsonify({
-            'error': 'Bad Request',
-            'message': 'The request could not be understood or was missing required parameters'
-        }), HTTP_BAD_REQUEST
+        logger.warning("Bad request: %s", error)
+        return json_response(bad_request_body, HTTP_BAD_REQUEST)
     
     @app.errorhandler(500)
     def handle_internal_error(error):
         """Handle 500 Internal Server errors"""
-        logger.error(f"Internal server error: {error}", exc_info=True)
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'An unexpected error occurred. Please try again later.'
-        }), HTTP_INTERNAL_ERROR
+        logger.error("Internal server error: %s", error, exc_info=True)
+        return json_response(internal_error_body, HTTP_INTERNAL_ERROR)
     
     @app.errorhandler(HTTPException)
     def handle_http_exception(error):
         """Handle all HTTP exceptions"""
-        logger.warning(f"HTTP exception: {error}")
-        return jsonify({
+        logger.warning("HTTP exception: %s", error)
+        return json_response({
             'error': error.name,
             'message': error.description
-        }), error.code
+        }, error.code)
     
     @app.errorhandler(Exception)
     def handle_unexpected_error(error):
         """Handle any unexpected errors"""
-        logger.critical(f"Unexpected error: {error}", exc_info=True)
-        return jsonify({
-            'error': 'Internal Server Error',
-            'message': 'An unexpected error occurred. Please try again later.'
-        }), HTTP_INTERNAL_ERROR
+        logger.critical("Unexpected error: %s", error, exc_info=True)
+        return json_response(internal_error_body, HTTP_INTERNAL_ERROR)
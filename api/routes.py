@@ -3,23 +3,158 @@ API Routes for E-Commerce Recommendation System
 Routes organized using Flask Blueprints
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, current_app
 from services.recommendation_service import RecommendationService
 from validators.validators import ValidationError
+from api.cache import cache
+from utils.helpers import json_dumps, json_response
+from config.config import Config
 from config.constants import (
-    HTTP_OK, HTTP_CREATED, HTTP_BAD_REQUEST, HTTP_INTERNAL_ERROR
+    HTTP_OK, HTTP_CREATED, HTTP_NOT_MODIFIED, HTTP_BAD_REQUEST, HTTP_INTERNAL_ERROR
 )
+import hashlib
 import logging
+import threading
+from concurrent.futures import Future
 
 # Create blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
 
-# Initialize service
-recommendation_service = RecommendationService()
-
 # Setup logger
 logger = logging.getLogger(__name__)
 
+_service_lock = threading.Lock()
+
+
+def _get_service():
+    """
+    Get the app-bound recommendation service, creating it on first use
+    
+    Returns:
+        RecommendationService instance stored in app.extensions
+    """
+    service = current_app.extensions.get('recommendation_service')
+    if service is None:
+        with _service_lock:
+            service = current_app.extensions.get('recommendation_service')
+            if service is None:
+                service = RecommendationService()
+                current_app.extensions['recommendation_service'] = service
+    return service
+
+
+def _parse_limit(default, max_limit):
+    """
+    Read the limit query parameter, clamped to [1, max_limit]
+    
+    Args:
+        default: Value used when limit is missing or not an integer
+        max_limit: Largest allowed limit
+        
+    Returns:
+        Limit within range
+    """
+    try:
+        limit = int(request.args.get('limit'))
+    except (TypeError, ValueError):
+        limit = default
+    return min(max(limit, 1), max_limit)
+
+
+# In-flight computations shared by concurrent identical requests
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _coalesce(key, func, *args):
+    """
+    Run func(*args) once for all concurrent callers using the same key
+    
+    The first caller computes the result; callers arriving while it is
+    in flight wait for and share that result (or exception).
+    
+    Args:
+        key: Hashable identifying the computation
+        func: Callable to run
+        *args: Arguments passed to func
+        
+    Returns:
+        Result of func(*args)
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[key] = future
+    
+    if not is_leader:
+        return future.result()
+    
+    try:
+        result = func(*args)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _conditional_json(key, func, *args):
+    """
+    Build a JSON response tagged with an ETag, or 304 if the client has it
+    
+    The ETag combines the catalogue version with the request key, so it
+    changes whenever the product data changes.
+    
+    Args:
+        key: Hashable identifying the request (also the coalescing key)
+        func: Callable returning the encoded JSON body
+        *args: Arguments passed to func
+        
+    Returns:
+        Flask Response
+    """
+    key_hash = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    etag = f"{_get_service().data_version}-{key_hash}"
+    
+    if request.if_none_match.contains(etag):
+        response = Response(status=HTTP_NOT_MODIFIED)
+    else:
+        response = json_response(_coalesce(key, func, *args), HTTP_OK)
+    
+    response.set_etag(etag)
+    return response
+
+
+# Static health payload, encoded once at import
+_HEALTH_BODY = json_dumps({
+    'status': 'healthy',
+    'service': 'E-Commerce Recommendation API',
+    'version': 'v1'
+})
+
+
+# Cached response bodies for endpoints whose results do not depend on the user.
+# Keyed by the function arguments; validation errors propagate and are not cached.
+@cache.memoize(timeout=Config.CACHE_TIMEOUT_SIMILAR)
+def _similar_body(product_id, limit):
+    return json_dumps(_get_service().get_similar_products(product_id, limit))
+
+
+@cache.memoize(timeout=Config.CACHE_TIMEOUT_TRENDING)
+def _trending_body(limit):
+    return json_dumps(_get_service().get_trending_products(limit))
+
+
+@cache.memoize(timeout=Config.CACHE_TIMEOUT_CATEGORY)
+def _category_body(category, limit):
+    return json_dumps(_get_service().get_products_by_category(category, limit))
+
 
 @api_bp.route('/recommendations/<string:user_id>', methods=['GET'])
 def get_recommendations(user_id):
@@ -40,7 +175,7 @@ def get_recommendations(user_id):
         type: integer
         required: false
         default: 5
-        description: Maximum number of recommendations to return (1-50)
+        description: Maximum number of recommendations to return (1-50, out-of-range values are clamped)
         example: 10
     responses:
       200:
@@ -98,17 +233,20 @@ def get_recommendations(user_id):
               example: "Internal server error"
     """
     try:
-        limit = request.args.get('limit', default=5, type=int)
-        result = recommendation_service.get_user_recommendations(user_id, limit)
-        return jsonify(result), HTTP_OK
+        limit = _parse_limit(Config.DEFAULT_RECOMMENDATIONS_LIMIT, Config.MAX_RECOMMENDATIONS_LIMIT)
+        result = _coalesce(
+            ('recommendations', user_id, limit),
+            _get_service().get_user_recommendations, user_id, limit
+        )
+        return json_response(result, HTTP_OK)
     
     except ValidationError as e:
-        logger.warning(f"Validation error in get_recommendations: {str(e)}")
-        return jsonify({'error': str(e)}), HTTP_BAD_REQUEST
+        logger.warning("Validation error in get_recommendations: %s", e)
+        return json_response({'error': str(e)}, HTTP_BAD_REQUEST)
     
     except Exception as e:
-        logger.error(f"Error in get_recommendations: {str(e)}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), HTTP_INTERNAL_ERROR
+        logger.error("Error in get_recommendations: %s", e, exc_info=True)
+        return json_response({'error': 'Internal server error'}, HTTP_INTERNAL_ERROR)
 
 
 @api_bp.route('/similar/<string:product_id>', methods=['GET'])
@@ -130,7 +268,7 @@ def get_similar(product_id):
         type: integer
         required: false
         default: 5
-        description: Maximum number of similar products to return (1-50)
+        description: Maximum number of similar products to return (1-50, out-of-range values are clamped)
         example: 5
     responses:
       200:
@@ -176,17 +314,16 @@ def get_similar(product_id):
         description: Internal server error
     """
     try:
-        limit = request.args.get('limit', default=5, type=int)
-        result = recommendation_service.get_similar_products(product_id, limit)
-        return jsonify(result), HTTP_OK
+        limit = _parse_limit(Config.DEFAULT_RECOMMENDATIONS_LIMIT, Config.MAX_RECOMMENDATIONS_LIMIT)
+        return _conditional_json(('similar', product_id, limit), _similar_body, product_id, limit)
     
     except ValidationError as e:
-        logger.warning(f"Validation error in get_similar: {str(e)}")
-        return jsonify({'error': str(e)}), HTTP_BAD_REQUEST
+        logger.warning("Validation error in get_similar: %s", e)
+        return json_response({'error': str(e)}, HTTP_BAD_REQUEST)
     
     except Exception as e:
-        logger.error(f"Error in get_similar: {str(e)}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), HTTP_INTERNAL_ERROR
+        logger.error("Error in get_similar: %s", e, exc_info=True)
+        return json_response({'error': 'Internal server error'}, HTTP_INTERNAL_ERROR)
 
 
 @api_bp.route('/trending', methods=['GET'])
@@ -202,7 +339,7 @@ def get_trending():
         type: integer
         required: false
         default: 10
-        description: Maximum number of trending products to return (1-100)
+        description: Maximum number of trending products to return (1-100, out-of-range values are clamped)
         example: 10
     responses:
       200:
@@ -247,17 +384,16 @@ def get_trending():
         description: Internal server error
     """
     try:
-        limit = request.args.get('limit', default=10, type=int)
-        result = recommendation_service.get_trending_products(limit)
-        return jsonify(result), HTTP_OK
+        limit = _parse_limit(Config.DEFAULT_PAGE_SIZE, Config.MAX_PAGE_SIZE)
+        return _conditional_json(('trending', limit), _trending_body, limit)
     
     except ValidationError as e:
-        logger.warning(f"Validation error in get_trending: {str(e)}")
-        return jsonify({'error': str(e)}), HTTP_BAD_REQUEST
+        logger.warning("Validation error in get_trending: %s", e)
+        return json_response({'error': str(e)}, HTTP_BAD_REQUEST)
     
     except Exception as e:
-        logger.error(f"Error in get_trending: {str(e)}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), HTTP_INTERNAL_ERROR
+        logger.error("Error in get_trending: %s", e, exc_info=True)
+        return json_response({'error': 'Internal server error'}, HTTP_INTERNAL_ERROR)
 
 
 @api_bp.route('/category/<string:category>', methods=['GET'])
@@ -280,7 +416,7 @@ def get_by_category(category):
         type: integer
         required: false
         default: 10
-        description: Maximum number of products to return (1-100)
+        description: Maximum number of products to return (1-100, out-of-range values are clamped)
         example: 10
     responses:
       200:
@@ -322,17 +458,16 @@ def get_by_category(category):
         description: Internal server error
     """
     try:
-        limit = request.args.get('limit', default=10, type=int)
-        result = recommendation_service.get_products_by_category(category, limit)
-        return jsonify(result), HTTP_OK
+        limit = _parse_limit(Config.DEFAULT_PAGE_SIZE, Config.MAX_PAGE_SIZE)
+        return _conditional_json(('category', category, limit), _category_body, category, limit)
     
     except ValidationError as e:
-        logger.warning(f"Validation error in get_by_category: {str(e)}")
-        return jsonify({'error': str(e)}), HTTP_BAD_REQUEST
+        logger.warning("Validation error in get_by_category: %s", e)
+        return json_response({'error': str(e)}, HTTP_BAD_REQUEST)
     
     except Exception as e:
-        logger.error(f"Error in get_by_category: {str(e)}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), HTTP_INTERNAL_ERROR
+        logger.error("Error in get_by_category: %s", e, exc_info=True)
+        return json_response({'error': 'Internal server error'}, HTTP_INTERNAL_ERROR)
 
 
 @api_bp.route('/interaction', methods=['POST'])
@@ -407,24 +542,24 @@ def add_interaction():
         data = request.get_json()
         
         if not data:
-            return jsonify({'error': 'Request body is required'}), HTTP_BAD_REQUEST
+            return json_response({'error': 'Request body is required'}, HTTP_BAD_REQUEST)
         
-        result = recommendation_service.add_user_interaction(
+        result = _get_service().add_user_interaction(
             user_id=data.get('user_id'),
             product_id=data.get('product_id'),
             interaction_type=data.get('interaction_type', 'view'),
             rating=data.get('rating')
         )
         
-        return jsonify(result), HTTP_CREATED
+        return json_response(result, HTTP_CREATED)
     
     except ValidationError as e:
-        logger.warning(f"Validation error in add_interaction: {str(e)}")
-        return jsonify({'error': str(e)}), HTTP_BAD_REQUEST
+        logger.warning("Validation error in add_interaction: %s", e)
+        return json_response({'error': str(e)}, HTTP_BAD_REQUEST)
     
     except Exception as e:
-        logger.error(f"Error in add_interaction: {str(e)}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), HTTP_INTERNAL_ERROR
+        logger.error("Error in add_interaction: %s", e, exc_info=True)
+        return json_response({'error': 'Internal server error'}, HTTP_INTERNAL_ERROR)
 
 
 @api_bp.route('/health', methods=['GET'])
@@ -450,8 +585,4 @@ def health_check():
               type: string
               example: "v1"
     """
-    return jsonify({
-        'status': 'healthy',
-        'service': 'E-Commerce Recommendation API',
-        'version': 'v1'
-    }), HTTP_OK
+    return json_response(_HEALTH_BODY, HTTP_OK)
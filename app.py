@@ -3,7 +3,7 @@ E-Commerce Recommendation System - Main Application
 Flask REST API with Factory Pattern and Clean Architecture
 """
 
-from flask import Flask, jsonify
+from flask import Flask, send_from_directory
 from flask_cors import CORS
 from flasgger import Swagger
 import os
@@ -11,8 +11,10 @@ import logging
 
 from config.config import get_config
 from api.routes import api_bp
+from api.cache import cache
 from api.error_handlers import register_error_handlers
 from utils.logging_config import setup_logging
+from utils.helpers import json_dumps, json_response
 from config.swagger_config import swagger_config, swagger_template
 
 
@@ -37,48 +39,85 @@ def create_app(config_name=None):
     config_class = get_config(config_name)
     app.config.from_object(config_class)
     
+    # Configure JSON provider
+    app.json.compact = app.config['JSON_COMPACT']
+    app.json.sort_keys = app.config['JSON_SORT_KEYS']
+    
     # Setup logging
     setup_logging(app)
     
-    # Initialize CORS
-    CORS(app, origins=app.config['CORS_ORIGINS'])
+    # Initialize CORS (wildcard uses flask-cors defaults)
+    cors_origins = app.config['CORS_ORIGINS']
+    if cors_origins == ('*',):
+        CORS(app)
+    else:
+        CORS(app, origins=list(cors_origins))
+    
+    # Initialize cache
+    cache.init_app(app)
     
     # Initialize Swagger
     Swagger(app, config=swagger_config, template=swagger_template)
     
+    # Serve the prebuilt spec instead of generating it from the routes
+    spec_file = app.config['API_SPEC_FILE']
+    if not app.config['DEBUG'] and os.path.exists(spec_file):
+        def prebuilt_apispec():
+            return send_from_directory(
+                os.path.dirname(spec_file),
+                os.path.basename(spec_file),
+                mimetype='application/json',
+                max_age=app.config['API_SPEC_MAX_AGE']
+            )
+        
+        app.view_functions['flasgger.apispec'] = prebuilt_apispec
+    
+    # Recommendation service is created lazily on the first API request
+    app.extensions['recommendation_service'] = None
+    
     # Register blueprints
     app.register_blueprint(api_bp)
     
     # Register error handlers
     register_error_handlers(app)
     
+    # Static payloads, encoded once per app
+    index_body = json_dumps({
+        'service': app.config['API_TITLE'],
+        'description': app.config['API_DESCRIPTION'],
+        'version': app.config['API_VERSION'],
+        'status': 'running'
+    })
+    health_body = json_dumps({
+        'status': 'healthy',
+        'message': 'E-Commerce Recommendation API is running'
+    })
+    
     # Root endpoint
     @app.route('/')
     def index():
-        return jsonify({
-            'service': app.config['API_TITLE'],
-            'description': app.config['API_DESCRIPTION'],
-            'version': app.config['API_VERSION'],
-            'status': 'running'
-        })
+        return json_response(index_body)
     
     # Legacy health endpoint for backward compatibility
     @app.route('/health')
     def health():
-        return jsonify({
-            'status': 'healthy',
-            'message': 'E-Commerce Recommendation API is running'
-        })
+        return json_response(health_body)
     
     app.logger.info(f"Application created with config: {config_name}")
     return app
 
 
-# Create app instance
-app = create_app()
-
-
 if __name__ == '__main__':
+    # Built here rather than at import so wsgi.py and tests importing
+    # create_app don't construct an extra development app
+    app = create_app()
+    
+    if app.config['ENV'] == 'production':
+        raise RuntimeError(
+            "The Flask development server must not be used in production; "
+            "run gunicorn -c gunicorn.conf.py instead"
+        )
+    
     port = app.config['PORT']
     host = app.config['HOST']
     debug = app.config['DEBUG']
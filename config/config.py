@@ -28,13 +28,33 @@ class Config:
     DEFAULT_RECOMMENDATIONS_LIMIT = 5
     MAX_RECOMMENDATIONS_LIMIT = 50
     
+    # JSON encoding (compact output, keep insertion order)
+    JSON_COMPACT = True
+    JSON_SORT_KEYS = False
+    
+    # Caching
+    CACHE_TYPE = 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 60
+    CACHE_TIMEOUT_TRENDING = 60
+    CACHE_TIMEOUT_CATEGORY = 120
+    CACHE_TIMEOUT_SIMILAR = 300
+    
     # Data paths
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     DATA_DIR = os.path.join(BASE_DIR, 'data')
     PRODUCTS_FILE = os.path.join(DATA_DIR, 'sample_products.csv')
     
-    # CORS
-    CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*')
+    # Prebuilt Swagger spec (scripts/build_spec.py), served outside debug mode
+    STATIC_DIR = os.path.join(BASE_DIR, 'static')
+    API_SPEC_FILE = os.path.join(STATIC_DIR, 'apispec.json')
+    API_SPEC_MAX_AGE = 3600
+    
+    # CORS (comma-separated list in the environment)
+    CORS_ORIGINS = tuple(
+        origin.strip()
+        for origin in os.getenv('CORS_ORIGINS', '*').split(',')
+        if origin.strip()
+    )
     
     # Server
     HOST = os.getenv('HOST', '0.0.0.0')
@@ -67,6 +87,8 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     ENV = 'testing'
+    CACHE_TYPE = 'NullCache'
+    CACHE_NO_NULL_WARNING = True
 
 
 # Configuration dictionary
@@ -9,12 +9,14 @@ INTERACTION_PURCHASE = 'purchase'
 INTERACTION_ADD_TO_CART = 'add_to_cart'
 INTERACTION_WISHLIST = 'wishlist'
 
-VALID_INTERACTION_TYPES = [
+# Ordered for error messages; the set is for membership checks
+VALID_INTERACTION_TYPES = (
     INTERACTION_VIEW,
     INTERACTION_PURCHASE,
     INTERACTION_ADD_TO_CART,
     INTERACTION_WISHLIST
-]
+)
+VALID_INTERACTION_TYPES_SET = frozenset(VALID_INTERACTION_TYPES)
 
 # Product Categories
 CATEGORY_ELECTRONICS = 'Electronics'
@@ -23,13 +25,15 @@ CATEGORY_BOOKS = 'Books'
 CATEGORY_HOME_KITCHEN = 'Home & Kitchen'
 CATEGORY_SPORTS = 'Sports'
 
-VALID_CATEGORIES = [
+# Ordered for error messages; categories are matched case-insensitively
+VALID_CATEGORIES = (
     CATEGORY_ELECTRONICS,
     CATEGORY_CLOTHING,
     CATEGORY_BOOKS,
     CATEGORY_HOME_KITCHEN,
     CATEGORY_SPORTS
-]
+)
+VALID_CATEGORIES_LOWER = frozenset(category.lower() for category in VALID_CATEGORIES)
 
 # Rating Constants
 MIN_RATING = 0.0
@@ -51,6 +55,7 @@ MSG_INTERNAL_ERROR = 'Internal server error'
 # HTTP Status Codes
 HTTP_OK = 200
 HTTP_CREATED = 201
+HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
 HTTP_NOT_FOUND = 404
 HTTP_INTERNAL_ERROR = 500
@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for E-Commerce Recommendation System
+gevent workers so a single process can serve many in-flight requests
+"""
+
+import multiprocessing
+import os
+
+# Application
+wsgi_app = 'wsgi:application'
+
+# Server socket
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5000')}"
+
+# Worker processes
+workers = int(os.getenv('GUNICORN_WORKERS', (2 * multiprocessing.cpu_count()) + 1))
+worker_class = 'gevent'
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+timeout = 30
+keepalive = 5
+
+# Import the application once in the master; workers fork from it
+preload_app = True
@@ -1,9 +1,90 @@
 import pandas as pd
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import MinMaxScaler
-from datetime import datetime, timedelta
+from collections import defaultdict
+from functools import lru_cache
+import time
+import hashlib
+import glob
 import os
+import threading
+
+from config.constants import (
+    TRENDING_WEIGHT_VIEWS,
+    TRENDING_WEIGHT_PURCHASES,
+    TRENDING_WEIGHT_RATING,
+    TRENDING_RATING_MULTIPLIER
+)
+
+try:
+    import faiss
+except ImportError:  # Optional ANN index; fall back to the dense similarity matrix
+    faiss = None
+
+try:
+    import simsimd
+except ImportError:  # Optional int8 SIMD kernels; fall back to float32 GEMM
+    simsimd = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional JIT; fall back to NumPy selection
+    njit = None
+
+try:
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional multithreaded CSV reader; fall back to pandas
+    pacsv = None
+
+
+def _read_csv(path):
+    """Read a CSV file into a DataFrame, with pyarrow when available"""
+    if pacsv is not None:
+        return pacsv.read_csv(path).to_pandas()
+    return pd.read_csv(path)
+
+
+def _top_indices(scores, limit):
+    """Indices of the highest scores, best first (ties by position)"""
+    limit = min(limit, len(scores))
+    if limit <= 0:
+        return np.empty(0, dtype=np.intp)
+    # Partition to find the cut-off score, keep every candidate tied with it
+    threshold = scores[np.argpartition(-scores, limit - 1)[:limit]].min()
+    candidates = np.flatnonzero(scores >= threshold)
+    return candidates[np.lexsort((candidates, -scores[candidates]))][:limit]
+
+
+def _top_indices_excluding_numpy(scores, limit, exclude):
+    """Top-k selection skipping index exclude (ties by position)"""
+    scores = scores.copy()
+    scores[exclude] = -np.inf
+    return _top_indices(scores, min(limit, len(scores) - 1))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _top_indices_excluding(scores, limit, exclude):
+        """Single-pass top-k selection skipping index exclude (ties by position)"""
+        top_idx = np.empty(limit, dtype=np.int64)
+        top_val = np.empty(limit, dtype=scores.dtype)
+        count = 0
+        for i in range(scores.shape[0]):
+            value = scores[i]
+            if i == exclude or (count == limit and value <= top_val[limit - 1]):
+                continue
+            j = count if count < limit else limit - 1
+            while j > 0 and top_val[j - 1] < value:
+                top_val[j] = top_val[j - 1]
+                top_idx[j] = top_idx[j - 1]
+                j -= 1
+            top_val[j] = value
+            top_idx[j] = i
+            if count < limit:
+                count += 1
+        return top_idx[:count]
+else:
+    _top_indices_excluding = _top_indices_excluding_numpy
 
 
 class RecommendationEngine:
@@ -15,11 +96,43 @@ class RecommendationEngine:
     - Trending Products
     """
     
+    # Catalogue size from which an HNSW index replaces the dense similarity matrix
+    ANN_MIN_PRODUCTS = 10000
+    ANN_HNSW_NEIGHBORS = 32
+    # ANN hits re-scored exactly per query; SQ8 scores are approximate (can exceed 1)
+    ANN_RERANK_CANDIDATES = 64
+    
+    _NO_ROWS = np.empty(0, dtype=np.intp)
+    
+    # Distinct (category, limit) / limit results memoized per engine
+    QUERY_CACHE_SIZE = 256
+    
+    # Field names of cached category / trending rows
+    _PRODUCT_FIELDS = ('product_id', 'name', 'category', 'price', 'rating')
+    _TRENDING_FIELDS = _PRODUCT_FIELDS + ('views', 'purchases')
+    
+    # Dense similarity matrices are saved here, keyed by data_version
+    SIMILARITY_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
+    # Bump when the features or the similarity computation change
+    SIMILARITY_CACHE_FORMAT = 1
+    
+    INTERACTION_COLUMNS = ['user_id', 'product_id', 'interaction_type', 'rating', 'timestamp']
+    
     def __init__(self):
         self.products_df = None
-        self.interactions_df = None
+        self._interactions = []
+        self._user_interactions = defaultdict(list)
+        self._interactions_df = None
         self.user_product_matrix = None
         self.product_similarity_matrix = None
+        self._feature_matrix = None
+        self._ann_index = None
+        self._q_features = None
+        self._trending_scores = None
+        self._trending_order = None
+        self._by_category = {}
+        self.data_version = None
+        self._interactions_lock = threading.Lock()
         self.load_data()
         self.initialize_models()
     
@@ -30,14 +143,58 @@ class RecommendationEngine:
         # Load or create sample product data
         products_file = os.path.join(data_dir, 'sample_products.csv')
         if os.path.exists(products_file):
-            self.products_df = pd.read_csv(products_file)
+            self.products_df = _read_csv(products_file)
         else:
             self.products_df = self._create_sample_products()
         
-        # Initialize empty interactions dataframe
-        self.interactions_df = pd.DataFrame(columns=[
-            'user_id', 'product_id', 'interaction_type', 'rating', 'timestamp'
-        ])
+        self._build_product_arrays()
+        
+        # Content hash of the catalogue, stable across workers and restarts
+        self.data_version = hashlib.blake2b(
+            pd.util.hash_pandas_object(self.products_df, index=True).values.tobytes(),
+            digest_size=8
+        ).hexdigest()
+        
+        # Initialize empty interactions buffer
+        self._interactions = []
+        self._user_interactions = defaultdict(list)
+        self._interactions_df = None
+    
+    def _build_product_arrays(self):
+        """Keep hot-path product fields as column arrays (structure of arrays)"""
+        df = self.products_df
+        self._product_ids = df['product_id'].to_numpy()
+        self._names = df['name'].to_numpy()
+        self._categories = df['category'].to_numpy()
+        self._prices = df['price'].to_numpy(dtype=np.float64)
+        self._ratings = df['rating'].to_numpy(dtype=np.float64)
+        self._views = df['views'].to_numpy(dtype=np.int64)
+        self._purchases = df['purchases'].to_numpy(dtype=np.int64)
+        
+        # product_id -> row, first occurrence wins like a mask lookup would
+        self._pid_to_idx = {}
+        for idx, product_id in enumerate(self._product_ids.tolist()):
+            self._pid_to_idx.setdefault(product_id, idx)
+        
+        # Integer category codes, looked up case-insensitively
+        codes, uniques = pd.factorize(df['category'].str.lower())
+        self._category_codes = codes
+        self._category_lookup = {name: code for code, name in enumerate(uniques)}
+    
+    @property
+    def interactions_df(self):
+        """All interactions as a DataFrame, materialized from the buffer on demand"""
+        interactions_df = self._interactions_df
+        if interactions_df is not None:
+            return interactions_df
+        
+        # Build under the lock so a concurrent write can't be left out of the cache
+        with self._interactions_lock:
+            if self._interactions_df is None:
+                self._interactions_df = pd.DataFrame(
+                    self._interactions, columns=self.INTERACTION_COLUMNS
+                )
+            return self._interactions_df
     
     def _create_sample_products(self):
         """Create sample product data"""
@@ -60,6 +217,13 @@ class RecommendationEngine:
         # Create product similarity matrix based on categories and ratings
         if not self.products_df.empty:
             self._compute_product_similarity()
+            self._compute_trending()
+            self._compute_category_index()
+            self._reset_query_caches()
+            
+            # Row lookups assume row-major layout (sequential cache lines per row)
+            for matrix in (self._feature_matrix, self.product_similarity_matrix):
+                assert matrix is None or matrix.flags['C_CONTIGUOUS']
     
     def _compute_product_similarity(self):
         """Compute product similarity based on features"""
@@ -72,10 +236,150 @@ class RecommendationEngine:
         normalized_features = scaler.fit_transform(numerical_features)
         
         # Combine features
-        features = np.hstack([category_dummies.values, normalized_features])
+        features = np.hstack([category_dummies.values, normalized_features]).astype(np.float32)
+        
+        # Normalize rows to unit length so cosine similarity is a plain dot product
+        norms = np.sqrt(np.einsum('ij,ij->i', features, features))
+        norms[norms == 0] = 1.0
+        features /= norms[:, np.newaxis]
+        self._feature_matrix = np.ascontiguousarray(features, dtype=np.float32)
+        
+        # Large catalogues: approximate nearest neighbours over the unit vectors
+        # (inner product == cosine) instead of an N x N matrix
+        if faiss is not None and len(features) >= self.ANN_MIN_PRODUCTS:
+            # 8-bit scalar quantized vectors: a quarter of the float32 memory/bandwidth
+            self._ann_index = faiss.IndexHNSWSQ(
+                features.shape[1], faiss.ScalarQuantizer.QT_8bit,
+                self.ANN_HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+            )
+            self._ann_index.train(features)
+            self._ann_index.add(features)
+            self.product_similarity_matrix = None
+            
+            # int8 copy of the unit vectors for on-demand similarity rows
+            if simsimd is not None:
+                self._q_features = np.ascontiguousarray(
+                    np.clip(np.rint(features * 127), -128, 127).astype(np.int8)
+                )
+            return
+        
+        self._ann_index = None
+        self._q_features = None
+        self.product_similarity_matrix = self._load_similarity_matrix()
+        if self.product_similarity_matrix is not None:
+            return
         
         # Compute cosine similarity
-        self.product_similarity_matrix = cosine_similarity(features)
+        self.product_similarity_matrix = np.ascontiguousarray(
+            np.dot(features, features.T), dtype=np.float32
+        )
+        self._save_similarity_matrix()
+    
+    def _similarity_cache_file(self):
+        """Path of the saved similarity matrix for the current catalogue"""
+        return os.path.join(
+            self.SIMILARITY_CACHE_DIR,
+            f'{self.data_version}_v{self.SIMILARITY_CACHE_FORMAT}_sim.npy'
+        )
+    
+    def _load_similarity_matrix(self):
+        """Memory-map a previously saved similarity matrix for this catalogue, if any"""
+        try:
+            matrix = np.load(self._similarity_cache_file(), mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        
+        n_products = len(self.products_df)
+        if matrix.shape != (n_products, n_products) or matrix.dtype != np.float32:
+            return None
+        return matrix
+    
+    def _save_similarity_matrix(self):
+        """Save the similarity matrix for warm starts; the cache is best effort"""
+        path = self._similarity_cache_file()
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.SIMILARITY_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, self.product_similarity_matrix)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        
+        # Only the current catalogue's matrix is ever read again
+        for stale_path in glob.glob(os.path.join(self.SIMILARITY_CACHE_DIR, '*_sim.npy')):
+            if os.path.abspath(stale_path) != os.path.abspath(path):
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+    
+    def _compute_trending(self):
+        """Compute trending scores and the product order they imply, once"""
+        self._trending_scores = (
+            self._views * TRENDING_WEIGHT_VIEWS +
+            self._purchases * TRENDING_WEIGHT_PURCHASES +
+            self._ratings * TRENDING_RATING_MULTIPLIER * TRENDING_WEIGHT_RATING
+        )
+        # Best first; stable so ties keep catalogue order
+        self._trending_order = np.argsort(-self._trending_scores, kind='stable')
+    
+    def _compute_category_index(self):
+        """Map each lowercased category to its rows, best rated first"""
+        # One stable sort groups rows by category code, best rated first within
+        # each group; rows without a category (code -1) are left out
+        rows = np.flatnonzero(self._category_codes >= 0)
+        codes = self._category_codes[rows]
+        order = rows[np.lexsort((-self._ratings[rows], codes))]
+        counts = np.bincount(codes, minlength=len(self._category_lookup))
+        groups = np.split(order, np.cumsum(counts)[:-1])
+        self._by_category = {
+            name: groups[code] for name, code in self._category_lookup.items()
+        }
+    
+    def _similarity_rows(self, indices):
+        """Similarity of the given products to every product (one row each)"""
+        if self.product_similarity_matrix is not None:
+            return self.product_similarity_matrix[indices]
+        if self._q_features is not None:
+            distances = simsimd.cdist(
+                np.ascontiguousarray(self._q_features[indices]), self._q_features,
+                metric='cosine'
+            )
+            return 1.0 - np.asarray(distances)
+        return np.dot(self._feature_matrix[indices], self._feature_matrix.T)
+    
+    def _product_rows(self, indices):
+        """Basic product fields for the given rows as native Python values"""
+        indices = np.asarray(indices, dtype=np.intp)
+        return zip(
+            self._product_ids[indices].tolist(),
+            self._names[indices].tolist(),
+            self._categories[indices].tolist(),
+            self._prices[indices].tolist(),
+            self._ratings[indices].tolist()
+        )
+    
+    def _similar_products_from(self, indices, scores):
+        """Build similar-product dicts for the given row indices and scores"""
+        scores = np.asarray(scores, dtype=np.float64).tolist()
+        return [
+            {
+                'product_id': product_id,
+                'name': name,
+                'category': category,
+                'price': price,
+                'rating': rating,
+                'similarity_score': score
+            }
+            for (product_id, name, category, price, rating), score
+            in zip(self._product_rows(indices), scores)
+        ]
     
     def get_recommendations_for_user(self, user_id, limit=5):
         """
@@ -83,130 +387,110 @@ class RecommendationEngine:
         Uses collaborative filtering if user has interactions, 
         otherwise returns trending products
         """
-        user_interactions = self.interactions_df[
-            self.interactions_df['user_id'] == user_id
-        ]
+        user_interactions = self._user_interactions.get(user_id)
         
-        if user_interactions.empty:
+        if not user_interactions:
             # New user - return trending products
             return self.get_trending_products(limit)
         
-        # Get products user has interacted with
-        interacted_products = set(user_interactions['product_id'].tolist())
+        if self._feature_matrix is None:
+            return []
         
-        # Get similar products based on user's interactions
-        recommendations = []
-        for product_id in interacted_products:
-            similar = self.get_similar_products(product_id, limit=10)
-            recommendations.extend(similar)
+        # Rows of the products user has interacted with, in catalogue order
+        pid_to_idx = self._pid_to_idx
+        interacted = {
+            pid_to_idx[interaction['product_id']]
+            for interaction in user_interactions
+            if interaction['product_id'] in pid_to_idx
+        }
+        if not interacted:
+            # Interactions only reference products not in the catalogue
+            return []
+        interacted_idx = np.sort(np.fromiter(interacted, dtype=np.intp, count=len(interacted)))
         
-        # Filter out already interacted products and get top N
-        recommendations = [
-            rec for rec in recommendations 
-            if rec['product_id'] not in interacted_products
-        ]
+        # Score every product by its mean similarity to the interacted ones,
+        # excluding the interacted products themselves
+        scores = self._similarity_rows(interacted_idx).mean(axis=0)
+        scores[interacted_idx] = -np.inf
         
-        # Remove duplicates and sort by score
-        seen = set()
-        unique_recommendations = []
-        for rec in recommendations:
-            if rec['product_id'] not in seen:
-                seen.add(rec['product_id'])
-                unique_recommendations.append(rec)
+        # Top N by score (ties broken by catalogue order)
+        limit = min(limit, len(scores) - len(interacted_idx))
+        top = _top_indices(scores, limit)
         
-        return unique_recommendations[:limit]
+        return self._similar_products_from(top, scores[top])
     
     def get_similar_products(self, product_id, limit=5):
         """Get similar products based on content-based filtering"""
-        if self.products_df.empty or self.product_similarity_matrix is None:
+        if self.products_df.empty or self._feature_matrix is None:
+            return []
+        
+        product_idx = self._pid_to_idx.get(product_id)
+        if product_idx is None:
             return []
         
         try:
-            # Find product index
-            product_idx = self.products_df[
-                self.products_df['product_id'] == product_id
-            ].index[0]
-            
-            # Get similarity scores
-            similarity_scores = list(enumerate(
-                self.product_similarity_matrix[product_idx]
-            ))
-            
-            # Sort by similarity (excluding the product itself)
-            similarity_scores = sorted(
-                similarity_scores, 
-                key=lambda x: x[1], 
-                reverse=True
-            )[1:limit+1]
+            if self._ann_index is not None:
+                # Over-fetch from the ANN index, then re-score the candidates
+                # exactly: the quantized inner products only pick candidates
+                query = self._feature_matrix[product_idx]
+                _, hits = self._ann_index.search(
+                    query[np.newaxis], max(limit + 1, self.ANN_RERANK_CANDIDATES)
+                )
+                candidates = np.unique(hits[0][hits[0] >= 0])
+                candidates = candidates[candidates != product_idx]
+                candidate_scores = self._feature_matrix[candidates] @ query
+                top = _top_indices(candidate_scores, min(limit, len(candidates)))
+                similarity_scores = list(zip(candidates[top], candidate_scores[top]))
+            else:
+                # Top scores in the product's similarity row, excluding itself
+                row = self.product_similarity_matrix[product_idx]
+                top = _top_indices_excluding(row, limit, product_idx)
+                similarity_scores = list(zip(top, row[top]))
             
             # Get similar products
-            similar_products = []
-            for idx, score in similarity_scores:
-                product = self.products_df.iloc[idx]
-                similar_products.append({
-                    'product_id': product['product_id'],
-                    'name': product['name'],
-                    'category': product['category'],
-                    'price': float(product['price']),
-                    'rating': float(product['rating']),
-                    'similarity_score': float(score)
-                })
-            
-            return similar_products
+            indices = [idx for idx, _ in similarity_scores]
+            scores = [score for _, score in similarity_scores]
+            return self._similar_products_from(indices, scores)
         except (IndexError, KeyError):
             return []
     
+    def _reset_query_caches(self):
+        """Memoize trending/category results; rebuilt whenever product data changes"""
+        self._trending_cached = lru_cache(maxsize=self.QUERY_CACHE_SIZE)(self._trending_products)
+        self._category_cached = lru_cache(maxsize=self.QUERY_CACHE_SIZE)(self._category_products)
+    
+    def _trending_products(self, limit):
+        """Trending product rows as a tuple of tuples (cached, immutable)"""
+        # Scores only change with the product data; order is precomputed
+        top = self._trending_order[:limit]
+        return tuple(
+            row + (views, purchases)
+            for row, views, purchases
+            in zip(self._product_rows(top), self._views[top].tolist(), self._purchases[top].tolist())
+        )
+    
+    def _category_products(self, category_lower, limit):
+        """Category product rows as a tuple of tuples (cached, immutable)"""
+        # Rows are pre-sorted by rating
+        category_idx = self._by_category.get(category_lower, self._NO_ROWS)
+        return tuple(self._product_rows(category_idx[:limit]))
+    
     def get_trending_products(self, limit=10):
         """Get trending products based on views and purchases"""
         if self.products_df.empty:
             return []
         
-        # Calculate trending score
-        df = self.products_df.copy()
-        df['trending_score'] = (
-            df['views'] * 0.3 + 
-            df['purchases'] * 0.5 + 
-            df['rating'] * 100 * 0.2
-        )
-        
-        # Sort by trending score
-        trending = df.nlargest(limit, 'trending_score')
-        
-        return [
-            {
-                'product_id': row['product_id'],
-                'name': row['name'],
-                'category': row['category'],
-                'price': float(row['price']),
-                'rating': float(row['rating']),
-                'views': int(row['views']),
-                'purchases': int(row['purchases'])
-            }
-            for _, row in trending.iterrows()
-        ]
+        # Fresh dicts per call so callers cannot mutate the cached rows
+        keys = self._TRENDING_FIELDS
+        return [dict(zip(keys, row)) for row in self._trending_cached(limit)]
     
     def get_products_by_category(self, category, limit=10):
         """Get products by category"""
         if self.products_df.empty:
             return []
         
-        category_products = self.products_df[
-            self.products_df['category'].str.lower() == category.lower()
-        ]
-        
-        # Sort by rating
-        category_products = category_products.nlargest(limit, 'rating')
-        
-        return [
-            {
-                'product_id': row['product_id'],
-                'name': row['name'],
-                'category': row['category'],
-                'price': float(row['price']),
-                'rating': float(row['rating'])
-            }
-            for _, row in category_products.iterrows()
-        ]
+        keys = self._PRODUCT_FIELDS
+        return [dict(zip(keys, row)) for row in self._category_cached(category.lower(), limit)]
     
     def add_user_interaction(self, user_id, product_id, 
                             interaction_type='view', rating=None):
@@ -216,12 +500,19 @@ class RecommendationEngine:
             'product_id': product_id,
             'interaction_type': interaction_type,
             'rating': rating,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time_ns()
         }
         
-        self.interactions_df = pd.concat([
-            self.interactions_df,
-            pd.DataFrame([new_interaction])
-        ], ignore_index=True)
+        # Append to the buffer; the DataFrame view is rebuilt on next access
+        with self._interactions_lock:
+            self._interactions.append(new_interaction)
+            self._user_interactions[user_id].append(new_interaction)
+            self._interactions_df = None
         
         return True
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Shared engine for the process; built once on first use"""
+    return RecommendationEngine()
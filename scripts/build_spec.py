@@ -0,0 +1,31 @@
+"""
+Build the static Swagger/OpenAPI spec served outside debug mode
+Usage: python scripts/build_spec.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+
+
+def build_spec():
+    """Render /apispec.json through the test client and write it to API_SPEC_FILE"""
+    # Testing config runs in debug mode, so flasgger generates the spec from the routes
+    app = create_app('testing')
+    response = app.test_client().get('/apispec.json')
+    if response.status_code != 200:
+        raise RuntimeError(f"Failed to render API spec: HTTP {response.status_code}")
+    
+    spec_file = app.config['API_SPEC_FILE']
+    os.makedirs(os.path.dirname(spec_file), exist_ok=True)
+    with open(spec_file, 'wb') as f:
+        f.write(response.data)
+    
+    print(f"API spec written to {spec_file}")
+
+
+if __name__ == '__main__':
+    build_spec()
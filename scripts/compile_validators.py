@@ -0,0 +1,71 @@
+"""
+Compile the validators module to a C extension with Cython
+Usage: python scripts/compile_validators.py [--clean]
+
+validators/validators.py is compiled as-is (Cython pure Python mode); the
+extension is written next to it and imported in preference to the source.
+Run with --clean to remove it and go back to the pure Python module.
+Requires Cython, setuptools and a C compiler.
+"""
+
+import glob
+import os
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_FILE = os.path.join('validators', 'validators.py')
+
+# Keep Python semantics: annotations are documentation, not C type checks
+COMPILER_DIRECTIVES = {
+    'language_level': 3,
+    'annotation_typing': False,
+    'boundscheck': False,
+    'wraparound': False
+}
+
+
+def _built_extensions():
+    """Compiled validators extension modules next to the source file"""
+    pattern = os.path.join(ROOT_DIR, 'validators', 'validators.*')
+    return [path for path in glob.glob(pattern) if path.endswith(('.so', '.pyd'))]
+
+
+def clean():
+    """Remove compiled validators so the pure Python module is imported"""
+    for path in _built_extensions():
+        os.remove(path)
+        print(f"Removed {path}")
+
+
+def compile_validators():
+    """Cythonize validators.py and build the extension in place"""
+    from Cython.Build import cythonize
+    from setuptools import Extension, setup
+    
+    os.chdir(ROOT_DIR)
+    with tempfile.TemporaryDirectory() as build_dir:
+        # Generated C and object files stay out of the source tree
+        ext_modules = cythonize(
+            [Extension('validators.validators', [SOURCE_FILE])],
+            compiler_directives=COMPILER_DIRECTIVES,
+            build_dir=build_dir,
+            quiet=True
+        )
+        setup(
+            name='validators',
+            ext_modules=ext_modules,
+            script_args=[
+                'build_ext', '--inplace',
+                '--build-temp', build_dir, '--build-lib', build_dir
+            ]
+        )
+    
+    print(f"Compiled validators: {', '.join(_built_extensions())}")
+
+
+if __name__ == '__main__':
+    if '--clean' in sys.argv[1:]:
+        clean()
+    else:
+        compile_validators()
@@ -4,8 +4,15 @@ Business logic separated from API routes
 """
 
 from typing import List, Dict, Any, Optional
-from models.recommendation_engine import RecommendationEngine
-from validators.validators import Validator, ValidationError
+from models.recommendation_engine import get_engine
+from validators.validators import (
+    ValidationError,
+    validate_user_id,
+    validate_product_id,
+    validate_limit,
+    validate_category,
+    validate_interaction_payload
+)
 from config.config import Config
 
 
@@ -16,8 +23,12 @@ class RecommendationService:
     """
     
     def __init__(self):
-        self.engine = RecommendationEngine()
-        self.validator = Validator()
+        self.engine = get_engine()
+    
+    @property
+    def data_version(self) -> str:
+        """Version of the product catalogue, changes when product data changes"""
+        return self.engine.data_version
     
     def get_user_recommendations(
         self, 
@@ -38,8 +49,8 @@ class RecommendationService:
             ValidationError: If validation fails
         """
         # Validate inputs
-        self.validator.validate_user_id(user_id)
-        limit = self.validator.validate_limit(limit, Config.MAX_RECOMMENDATIONS_LIMIT)
+        validate_user_id(user_id)
+        limit = validate_limit(limit, Config.MAX_RECOMMENDATIONS_LIMIT)
         
         # Get recommendations from engine
         recommendations = self.engine.get_recommendations_for_user(user_id, limit)
@@ -69,8 +80,8 @@ class RecommendationService:
             ValidationError: If validation fails
         """
         # Validate inputs
-        self.validator.validate_product_id(product_id)
-        limit = self.validator.validate_limit(limit, Config.MAX_RECOMMENDATIONS_LIMIT)
+        validate_product_id(product_id)
+        limit = validate_limit(limit, Config.MAX_RECOMMENDATIONS_LIMIT)
         
         # Get similar products from engine
         similar_products = self.engine.get_similar_products(product_id, limit)
@@ -98,7 +109,7 @@ class RecommendationService:
             ValidationError: If validation fails
         """
         # Validate inputs
-        limit = self.validator.validate_limit(limit, Config.MAX_PAGE_SIZE)
+        limit = validate_limit(limit, Config.MAX_PAGE_SIZE)
         
         # Get trending products from engine
         trending = self.engine.get_trending_products(limit)
@@ -127,8 +138,8 @@ class RecommendationService:
             ValidationError: If validation fails
         """
         # Validate inputs
-        self.validator.validate_category(category)
-        limit = self.validator.validate_limit(limit, Config.MAX_PAGE_SIZE)
+        validate_category(category)
+        limit = validate_limit(limit, Config.MAX_PAGE_SIZE)
         
         # Get products from engine
         products = self.engine.get_products_by_category(category, limit)
@@ -168,7 +179,7 @@ class RecommendationService:
             'interaction_type': interaction_type,
             'rating': rating
         }
-        validated_data = self.validator.validate_interaction_payload(payload)
+        validated_data = validate_interaction_payload(payload)
         
         # Add interaction through engine
         self.engine.add_user_interaction(
@@ -1,90 +1,91 @@
 """
 Test script for E-Commerce Recommendation API
 Run this after starting the Flask server to test all endpoints
+Requires httpx (pip install httpx)
 """
 
-import requests
+import asyncio
 import json
 
 BASE_URL = "http://localhost:5000/api/v1"
 
 
-def test_health_check():
-    """Test health check endpoint"""
-    print("\n=== Testing Health Check ===")
-    response = requests.get(f"{BASE_URL}/health")
+def print_response(title, response):
+    """Print the status code and JSON body of a response"""
+    print(f"\n=== Testing {title} ===")
     print(f"Status Code: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
 
 
-def test_trending_products():
-    """Test trending products endpoint"""
-    print("\n=== Testing Trending Products ===")
-    response = requests.get(f"{BASE_URL}/trending?limit=5")
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+async def check_health(client):
+    """Check health check endpoint"""
+    response = await client.get("/health")
+    print_response("Health Check", response)
 
 
-def test_similar_products():
-    """Test similar products endpoint"""
-    print("\n=== Testing Similar Products ===")
-    response = requests.get(f"{BASE_URL}/similar/P001?limit=5")
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+async def check_trending_products(client):
+    """Check trending products endpoint"""
+    response = await client.get("/trending", params={'limit': 5})
+    print_response("Trending Products", response)
 
 
-def test_category_products():
-    """Test category products endpoint"""
-    print("\n=== Testing Category Products ===")
-    response = requests.get(f"{BASE_URL}/category/Electronics?limit=5")
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+async def check_similar_products(client):
+    """Check similar products endpoint"""
+    response = await client.get("/similar/P001", params={'limit': 5})
+    print_response("Similar Products", response)
+
 
+async def check_category_products(client):
+    """Check category products endpoint"""
+    response = await client.get("/category/Electronics", params={'limit': 5})
+    print_response("Category Products", response)
 
-def test_add_interaction():
-    """Test add interaction endpoint"""
-    print("\n=== Testing Add User Interaction ===")
+
+async def check_add_interaction(client):
+    """Check add interaction endpoint"""
     interaction_data = {
         'user_id': 'test_user_001',
         'product_id': 'P001',
         'interaction_type': 'view',
         'rating': 4.5
     }
-    response = requests.post(
-        f"{BASE_URL}/interaction",
-        json=interaction_data
-    )
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    response = await client.post("/interaction", json=interaction_data)
+    print_response("Add User Interaction", response)
 
 
-def test_user_recommendations():
-    """Test user recommendations endpoint"""
-    print("\n=== Testing User Recommendations ===")
-    response = requests.get(f"{BASE_URL}/recommendations/test_user_001?limit=5")
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+async def check_user_recommendations(client):
+    """Check user recommendations endpoint"""
+    response = await client.get("/recommendations/test_user_001", params={'limit': 5})
+    print_response("User Recommendations", response)
 
 
-def run_all_tests():
+async def run_all_tests():
     """Run all API tests"""
+    # Imported here so collecting this script as a test module doesn't need httpx
+    import httpx
+    
     print("=" * 60)
     print("Starting API Tests...")
     print("Make sure the Flask server is running on http://localhost:5000")
     print("=" * 60)
     
     try:
-        test_health_check()
-        test_trending_products()
-        test_similar_products()
-        test_category_products()
-        test_add_interaction()
-        test_user_recommendations()
+        async with httpx.AsyncClient(base_url=BASE_URL) as client:
+            # Read-only endpoints are independent, run them concurrently
+            await asyncio.gather(
+                check_health(client),
+                check_trending_products(client),
+                check_similar_products(client),
+                check_category_products(client)
+            )
+            # Recommendations depend on the interaction being recorded first
+            await check_add_interaction(client)
+            await check_user_recommendations(client)
         
         print("\n" + "=" * 60)
         print("✅ All Tests Completed Successfully!")
         print("=" * 60)
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("\n" + "=" * 60)
         print("❌ Error: Could not connect to the server.")
         print("Please make sure the Flask server is running on http://localhost:5000")
@@ -94,4 +95,4 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    run_all_tests()
+    asyncio.run(run_all_tests())
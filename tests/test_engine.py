@@ -0,0 +1,283 @@
+"""
+Unit Tests for Recommendation Engine
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from models import recommendation_engine
+from models.recommendation_engine import RecommendationEngine
+
+
+_cache_dir = None
+_cache_dir_patch = None
+
+
+def setUpModule():
+    """Save similarity matrices from test engines outside the repo's cache/"""
+    global _cache_dir, _cache_dir_patch
+    _cache_dir = tempfile.TemporaryDirectory()
+    _cache_dir_patch = mock.patch.object(
+        RecommendationEngine, 'SIMILARITY_CACHE_DIR', _cache_dir.name
+    )
+    _cache_dir_patch.start()
+
+
+def tearDownModule():
+    """Restore the default cache directory"""
+    _cache_dir_patch.stop()
+    _cache_dir.cleanup()
+
+
+class TestRecommendations(unittest.TestCase):
+    """Test personalized recommendations"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = RecommendationEngine()
+    
+    def test_unknown_products_only(self):
+        """Test a user with only unknown product interactions gets no results or warnings"""
+        self.engine.add_user_interaction('ghost_user', 'P999')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(self.engine.get_recommendations_for_user('ghost_user', 5), [])
+    
+    def test_excludes_interacted_products(self):
+        """Test recommendations leave out products the user interacted with"""
+        self.engine.add_user_interaction('known_user', 'P001')
+        recommendations = self.engine.get_recommendations_for_user('known_user', 5)
+        self.assertEqual(len(recommendations), 5)
+        self.assertNotIn('P001', [product['product_id'] for product in recommendations])
+
+
+class TestQueryCaches(unittest.TestCase):
+    """Test memoized trending/category results are isolated from callers"""
+    
+    def setUp(self):
+        self.engine = RecommendationEngine()
+    
+    def test_mutating_trending_result(self):
+        """Test changing a returned trending product does not leak into later calls"""
+        first = self.engine.get_trending_products(3)
+        first[0]['name'] = 'changed'
+        first.clear()
+        second = self.engine.get_trending_products(3)
+        self.assertEqual(len(second), 3)
+        self.assertNotEqual(second[0]['name'], 'changed')
+    
+    def test_mutating_category_result(self):
+        """Test changing a returned category product does not leak into later calls"""
+        first = self.engine.get_products_by_category('Books', 3)
+        first[0]['price'] = -1
+        second = self.engine.get_products_by_category('books', 3)
+        self.assertNotEqual(second[0]['price'], -1)
+        self.assertEqual(
+            set(second[0]),
+            {'product_id', 'name', 'category', 'price', 'rating'}
+        )
+    
+    def test_new_user_gets_independent_trending(self):
+        """Test new-user recommendations do not share dicts with trending results"""
+        recommendations = self.engine.get_recommendations_for_user('nobody', 2)
+        recommendations[0]['views'] = -1
+        self.assertNotEqual(self.engine.get_trending_products(2)[0]['views'], -1)
+
+
+class TestSimilarProducts(unittest.TestCase):
+    """Test content-based similar products"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = RecommendationEngine()
+    
+    def test_duplicate_product_excludes_itself(self):
+        """Test a product with an identical twin lists the twin, not itself"""
+        # P011 and P046 share category, price and rating in the sample data
+        similar = [p['product_id'] for p in self.engine.get_similar_products('P046', 3)]
+        self.assertEqual(similar[0], 'P011')
+        self.assertNotIn('P046', similar)
+        similar = [p['product_id'] for p in self.engine.get_similar_products('P011', 3)]
+        self.assertEqual(similar[0], 'P046')
+        self.assertNotIn('P011', similar)
+    
+    def test_never_lists_itself(self):
+        """Test no product appears in its own similar products"""
+        for product_id in self.engine.products_df['product_id']:
+            similar = self.engine.get_similar_products(product_id, 5)
+            self.assertNotIn(product_id, [p['product_id'] for p in similar])
+    
+    def test_unknown_product(self):
+        """Test unknown product returns no similar products"""
+        self.assertEqual(self.engine.get_similar_products('P999', 5), [])
+
+
+@unittest.skipIf(recommendation_engine.faiss is None, "faiss is not installed")
+class TestAnnIndex(unittest.TestCase):
+    """Test similar products from the HNSW index used for large catalogues"""
+    
+    @classmethod
+    def setUpClass(cls):
+        class Engine(RecommendationEngine):
+            ANN_MIN_PRODUCTS = 0
+        cls.engine = Engine()
+    
+    def test_scores_are_exact_cosine(self):
+        """Test quantized ANN scores are replaced by exact cosine similarities"""
+        features = self.engine._feature_matrix
+        for product_id in self.engine.products_df['product_id']:
+            product_idx = self.engine._pid_to_idx[product_id]
+            exact = np.delete(features @ features[product_idx], product_idx)
+            scores = [
+                p['similarity_score'] for p in self.engine.get_similar_products(product_id, 5)
+            ]
+            np.testing.assert_allclose(scores, np.sort(exact)[::-1][:5], atol=1e-5)
+    
+    def test_similar_products(self):
+        """Test ANN results exclude the product itself and are valid similarities"""
+        self.assertIsNotNone(self.engine._ann_index)
+        self.assertIsNone(self.engine.product_similarity_matrix)
+        for product_id in self.engine.products_df['product_id']:
+            similar = self.engine.get_similar_products(product_id, 5)
+            self.assertEqual(len(similar), 5)
+            self.assertNotIn(product_id, [p['product_id'] for p in similar])
+            for product in similar:
+                self.assertGreaterEqual(product['similarity_score'], 0.0)
+                self.assertLessEqual(product['similarity_score'], 1.0)
+    
+    def test_user_recommendations(self):
+        """Test user recommendations from on-demand similarity rows"""
+        if recommendation_engine.simsimd is not None:
+            # int8 vectors scored by simsimd
+            self.assertIsNotNone(self.engine._q_features)
+        self.engine.add_user_interaction('ann_user', 'P001')
+        self.engine.add_user_interaction('ann_user', 'P004')
+        recommendations = self.engine.get_recommendations_for_user('ann_user', 5)
+        self.assertEqual(len(recommendations), 5)
+        product_ids = [p['product_id'] for p in recommendations]
+        self.assertNotIn('P001', product_ids)
+        self.assertNotIn('P004', product_ids)
+        for product in recommendations:
+            self.assertGreaterEqual(product['similarity_score'], 0.0)
+            self.assertLessEqual(product['similarity_score'], 1.0)
+        
+        # Same ranking as exact float32 similarity rows, up to int8 rounding
+        indices = np.array([self.engine._pid_to_idx['P001'], self.engine._pid_to_idx['P004']])
+        rows = self.engine._similarity_rows(indices)
+        exact = self.engine._feature_matrix[indices] @ self.engine._feature_matrix.T
+        np.testing.assert_allclose(rows, exact, atol=0.02)
+
+
+class TestTopIndices(unittest.TestCase):
+    """Test top-k selection helpers"""
+    
+    SCORES = np.array([0.5, 0.9, 0.9, 0.1, 0.9, 0.5, 0.9], dtype=np.float32)
+    
+    def test_numpy_ties_by_position(self):
+        """Test ties are broken by position and the excluded index is skipped"""
+        top = recommendation_engine._top_indices_excluding_numpy(self.SCORES, 4, 2)
+        self.assertEqual(top.tolist(), [1, 4, 6, 0])
+    
+    def test_numba_matches_numpy(self):
+        """Test the compiled selection returns the same order as the NumPy fallback"""
+        if recommendation_engine.njit is None:
+            self.skipTest("numba is not installed")
+        for exclude in range(len(self.SCORES)):
+            for limit in range(1, len(self.SCORES)):
+                expected = recommendation_engine._top_indices_excluding_numpy(
+                    self.SCORES, limit, exclude
+                )
+                actual = recommendation_engine._top_indices_excluding(self.SCORES, limit, exclude)
+                self.assertEqual(actual.tolist(), expected.tolist())
+
+
+class TestSimilarityCache(unittest.TestCase):
+    """Test the on-disk similarity matrix cache"""
+    
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        
+        class Engine(RecommendationEngine):
+            SIMILARITY_CACHE_DIR = self.cache_dir.name
+        self.engine_class = Engine
+    
+    def test_save_removes_stale_matrices(self):
+        """Test saving keeps only the current catalogue's matrix"""
+        for name in ('0123456789abcdef_sim.npy', '0123456789abcdef_v0_sim.npy', 'notes.txt'):
+            open(os.path.join(self.cache_dir.name, name), 'wb').close()
+        
+        engine = self.engine_class()
+        self.assertEqual(
+            sorted(os.listdir(self.cache_dir.name)),
+            sorted([os.path.basename(engine._similarity_cache_file()), 'notes.txt'])
+        )
+    
+    def test_filename_includes_format(self):
+        """Test a format bump changes the cache file"""
+        engine = self.engine_class()
+        path = engine._similarity_cache_file()
+        self.assertIn(f'_v{engine.SIMILARITY_CACHE_FORMAT}_', path)
+        
+        engine.SIMILARITY_CACHE_FORMAT += 1
+        self.assertNotEqual(engine._similarity_cache_file(), path)
+        self.assertIsNone(engine._load_similarity_matrix())
+    
+    def test_warm_start_loads_saved_matrix(self):
+        """Test a second engine memory-maps the saved matrix"""
+        cold = self.engine_class()
+        warm = self.engine_class()
+        self.assertIsInstance(warm.product_similarity_matrix, np.memmap)
+        np.testing.assert_array_equal(
+            warm.product_similarity_matrix, cold.product_similarity_matrix
+        )
+
+
+class TestInteractions(unittest.TestCase):
+    """Test the interaction buffer"""
+    
+    def test_interactions_df_reflects_writes(self):
+        """Test the cached DataFrame is rebuilt after each write"""
+        engine = RecommendationEngine()
+        engine.add_user_interaction('user1', 'P001', 'view')
+        self.assertEqual(len(engine.interactions_df), 1)
+        engine.add_user_interaction('user1', 'P002', 'purchase', 4.0)
+        interactions_df = engine.interactions_df
+        self.assertEqual(len(interactions_df), 2)
+        self.assertIs(engine.interactions_df, interactions_df)
+        self.assertEqual(interactions_df['product_id'].tolist(), ['P001', 'P002'])
+    
+    def test_write_during_materialize_not_lost(self):
+        """Test a write racing the DataFrame build invalidates it rather than being dropped"""
+        engine = RecommendationEngine()
+        engine.add_user_interaction('user1', 'P001', 'view')
+        
+        build_dataframe = pd.DataFrame
+        writer = threading.Thread(
+            target=engine.add_user_interaction, args=('user2', 'P002', 'view')
+        )
+        
+        def slow_build(*args, **kwargs):
+            # The write lands (or blocks on the lock) after the buffer is copied
+            # but before the DataFrame is cached
+            interactions_df = build_dataframe(*args, **kwargs)
+            writer.start()
+            writer.join(timeout=0.2)
+            return interactions_df
+        
+        with mock.patch.object(recommendation_engine.pd, 'DataFrame', side_effect=slow_build):
+            engine.interactions_df
+        writer.join()
+        
+        self.assertEqual(engine.interactions_df['product_id'].tolist(), ['P001', 'P002'])
+
+
+if __name__ == '__main__':
+    unittest.main()
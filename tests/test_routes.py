@@ -0,0 +1,185 @@
+"""
+Unit Tests for API Routes
+"""
+
+import tempfile
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+from app import create_app
+from api import routes
+from api.routes import _parse_limit
+from config.config import Config
+from models.recommendation_engine import RecommendationEngine
+
+
+_cache_dir = None
+_cache_dir_patch = None
+
+
+def setUpModule():
+    """Keep the shared engine's similarity matrix out of the repo's cache/"""
+    global _cache_dir, _cache_dir_patch
+    _cache_dir = tempfile.TemporaryDirectory()
+    _cache_dir_patch = mock.patch.object(
+        RecommendationEngine, 'SIMILARITY_CACHE_DIR', _cache_dir.name
+    )
+    _cache_dir_patch.start()
+
+
+def tearDownModule():
+    """Restore the default cache directory"""
+    _cache_dir_patch.stop()
+    _cache_dir.cleanup()
+
+
+class TestLimitParameter(unittest.TestCase):
+    """Test the limit query parameter is clamped rather than rejected"""
+    
+    def setUp(self):
+        self.client = create_app('testing').test_client()
+    
+    def _trending_count(self, limit):
+        response = self.client.get(f'/api/v1/trending?limit={limit}')
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()['count']
+    
+    def test_limit_zero_clamped_to_one(self):
+        """Test zero limit returns one product"""
+        self.assertEqual(self._trending_count(0), 1)
+    
+    def test_limit_negative_clamped_to_one(self):
+        """Test negative limit returns one product"""
+        self.assertEqual(self._trending_count(-3), 1)
+    
+    def test_limit_not_integer_uses_default(self):
+        """Test non-integer limit falls back to the default"""
+        self.assertEqual(self._trending_count('abc'), Config.DEFAULT_PAGE_SIZE)
+    
+    def test_limit_above_max_clamped(self):
+        """Test limit above the maximum is clamped"""
+        with self.client.application.test_request_context('/?limit=1000'):
+            self.assertEqual(_parse_limit(5, 50), 50)
+
+
+class TestConditionalRequests(unittest.TestCase):
+    """Test ETag revalidation on cacheable endpoints"""
+    
+    URLS = (
+        '/api/v1/trending?limit=5',
+        '/api/v1/category/Books?limit=5',
+        '/api/v1/similar/P001?limit=5'
+    )
+    
+    def setUp(self):
+        self.client = create_app('testing').test_client()
+    
+    def test_matching_etag_returns_not_modified(self):
+        """Test If-None-Match with the current ETag returns 304 and the same ETag"""
+        for url in self.URLS:
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200)
+            etag = first.headers['ETag']
+            
+            second = self.client.get(url, headers={'If-None-Match': etag})
+            self.assertEqual(second.status_code, 304, url)
+            self.assertEqual(second.headers['ETag'], etag)
+            self.assertEqual(second.data, b'')
+    
+    def test_stale_etag_returns_body(self):
+        """Test If-None-Match with another ETag returns the full response"""
+        response = self.client.get(self.URLS[0], headers={'If-None-Match': '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['count'], 5)
+    
+    def test_etag_differs_per_request(self):
+        """Test different parameters get different ETags"""
+        etags = {self.client.get(url).headers['ETag'] for url in self.URLS}
+        self.assertEqual(len(etags), len(self.URLS))
+
+
+class TestCoalesce(unittest.TestCase):
+    """Test concurrent identical computations are shared"""
+    
+    WAITERS = 8
+    
+    def setUp(self):
+        # Count callers blocked on the leader's result
+        self.waiting = threading.Semaphore(0)
+        waiting = self.waiting
+        
+        class CountingFuture(Future):
+            def result(self, timeout=None):
+                waiting.release()
+                return super().result(timeout)
+        
+        patcher = mock.patch.object(routes, 'Future', CountingFuture)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _run_concurrently(self, func):
+        """Call _coalesce from a leader and WAITERS followers; return outcomes"""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        outcomes = []
+        
+        def blocking():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return func()
+        
+        def call():
+            try:
+                outcomes.append(routes._coalesce('key', blocking))
+            except Exception as e:
+                outcomes.append(e)
+        
+        leader = threading.Thread(target=call)
+        leader.start()
+        self.assertTrue(started.wait(5))
+        followers = [threading.Thread(target=call) for _ in range(self.WAITERS)]
+        for thread in followers:
+            thread.start()
+        for _ in followers:
+            self.assertTrue(self.waiting.acquire(timeout=5))
+        
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(routes._inflight, {})
+        return outcomes
+    
+    def test_concurrent_callers_share_result(self):
+        """Test the function runs once and every caller gets the same object"""
+        result = object()
+        outcomes = self._run_concurrently(lambda: result)
+        self.assertEqual(len(outcomes), self.WAITERS + 1)
+        for outcome in outcomes:
+            self.assertIs(outcome, result)
+    
+    def test_exception_reaches_every_caller(self):
+        """Test an exception from the function is raised to every waiter"""
+        error = ValueError("boom")
+        
+        def fail():
+            raise error
+        
+        outcomes = self._run_concurrently(fail)
+        self.assertEqual(len(outcomes), self.WAITERS + 1)
+        for outcome in outcomes:
+            self.assertIs(outcome, error)
+    
+    def test_sequential_calls_recompute(self):
+        """Test results are not kept once no caller is waiting"""
+        results = iter([1, 2])
+        self.assertEqual(routes._coalesce('key', lambda: next(results)), 1)
+        self.assertEqual(routes._coalesce('key', lambda: next(results)), 2)
+        self.assertEqual(routes._inflight, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
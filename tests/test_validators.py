@@ -3,6 +3,11 @@ Unit Tests for Validators
 """
 
 import unittest
+from unittest import mock
+
+import pandas as pd
+
+from validators import validators
 from validators.validators import Validator, ValidationError
 
 
@@ -26,6 +31,17 @@ class TestValidators(unittest.TestCase):
         with self.assertRaises(ValidationError):
             self.validator.validate_user_id(None)
     
+    def test_validate_user_id_not_string(self):
+        """Test non-string user ID"""
+        with self.assertRaises(ValidationError):
+            self.validator.validate_user_id(123)
+    
+    def test_validate_user_id_length_bounds(self):
+        """Test user ID length limits"""
+        self.assertTrue(self.validator.validate_user_id("u" * 100))
+        with self.assertRaises(ValidationError):
+            self.validator.validate_user_id("u" * 101)
+    
     def test_validate_product_id_valid(self):
         """Test valid product ID"""
         self.assertTrue(self.validator.validate_product_id("P001"))
@@ -44,6 +60,15 @@ class TestValidators(unittest.TestCase):
         with self.assertRaises(ValidationError):
             self.validator.validate_rating(6.0)
     
+    def test_validate_rating_numeric_string(self):
+        """Test numeric string rating is converted"""
+        self.assertTrue(self.validator.validate_rating("4"))
+    
+    def test_validate_rating_bool(self):
+        """Test boolean rating is rejected"""
+        with self.assertRaises(ValidationError):
+            self.validator.validate_rating(True)
+    
     def test_validate_rating_none(self):
         """Test None rating (should be valid)"""
         self.assertTrue(self.validator.validate_rating(None))
@@ -80,6 +105,11 @@ class TestValidators(unittest.TestCase):
         """Test category validation is case insensitive"""
         self.assertTrue(self.validator.validate_category("electronics"))
     
+    def test_validate_category_mixed_case(self):
+        """Test upper and mixed case categories are accepted"""
+        for category in ("HOME & KITCHEN", "hOmE & kItChEn", "Home & Kitchen"):
+            self.assertTrue(self.validator.validate_category(category))
+    
     def test_validate_category_invalid(self):
         """Test invalid category"""
         with self.assertRaises(ValidationError):
@@ -99,11 +129,135 @@ class TestValidators(unittest.TestCase):
         self.assertEqual(result['interaction_type'], 'purchase')
         self.assertEqual(result['rating'], 4.5)
     
+    def test_validate_interaction_payload_defaults(self):
+        """Test optional payload fields get their defaults"""
+        result = self.validator.validate_interaction_payload(
+            {'user_id': 'user123', 'product_id': 'P001'}
+        )
+        self.assertEqual(result, {
+            'user_id': 'user123',
+            'product_id': 'P001',
+            'interaction_type': 'view',
+            'rating': None
+        })
+    
     def test_validate_interaction_payload_missing_required(self):
         """Test interaction payload missing required fields"""
         payload = {'user_id': 'user123'}
         with self.assertRaises(ValidationError):
             self.validator.validate_interaction_payload(payload)
+    
+    def test_validate_interaction_payload_none_required(self):
+        """Test required fields explicitly set to None count as missing"""
+        payload = {'user_id': 'user123', 'product_id': None}
+        with self.assertRaisesRegex(ValidationError, "product_id"):
+            self.validator.validate_interaction_payload(payload)
+
+
+class TestValidatorFunctions(unittest.TestCase):
+    """Test module-level validation functions"""
+    
+    def test_functions_validate_directly(self):
+        """Test module functions validate without a Validator instance"""
+        self.assertTrue(validators.validate_user_id("user123"))
+        self.assertTrue(validators.validate_category("books"))
+        self.assertEqual(validators.validate_limit("7"), 7)
+        with self.assertRaises(ValidationError):
+            validators.validate_product_id("")
+    
+    def test_check_functions_return_messages(self):
+        """Test check functions return None or the error message instead of raising"""
+        self.assertIsNone(validators.check_user_id("user123"))
+        self.assertIsNone(validators.check_rating(None))
+        self.assertEqual(validators.check_product_id(""), "Product ID must be a non-empty string")
+        self.assertIn("Invalid interaction type", validators.check_interaction_type("click"))
+        self.assertIn("Invalid category", validators.check_category("Toys"))
+        self.assertIn("Rating must be between", validators.check_rating(7))
+    
+    def test_validate_interactions_df_valid(self):
+        """Test a valid interactions batch is returned unchanged"""
+        df = pd.DataFrame({
+            'user_id': ['user1', 'user2', 'user3'],
+            'product_id': ['P001', 'P002', 'P003'],
+            'interaction_type': ['view', 'purchase', 'wishlist'],
+            'rating': [4.5, None, '3']
+        })
+        self.assertIs(validators.validate_interactions_df(df), df)
+    
+    def test_validate_interactions_df_invalid_rows(self):
+        """Test invalid rows are reported by index"""
+        df = pd.DataFrame({
+            'user_id': ['user1', '', 'user3', 'user4', 'user5'],
+            'product_id': ['P001', 'P002', None, 'P004', 'P005'],
+            'interaction_type': ['view', 'view', 'view', 'click', 'view'],
+            'rating': [4.0, 4.0, 4.0, 4.0, 'great']
+        })
+        with self.assertRaisesRegex(ValidationError, r"4 invalid interaction rows, first at: \[1, 2, 3, 4\]"):
+            validators.validate_interactions_df(df)
+        
+        # Booleans mixed into an object rating column are not ratings
+        for ratings, invalid_row in (([True, 4.0], 0), ([4.0, False], 1), ([True, '3'], 0)):
+            df = pd.DataFrame({
+                'user_id': ['user1', 'user2'],
+                'product_id': ['P001', 'P002'],
+                'rating': ratings
+            })
+            with self.assertRaisesRegex(ValidationError, rf"1 invalid interaction rows, first at: \[{invalid_row}\]"):
+                validators.validate_interactions_df(df)
+    
+    def test_validate_interactions_df_non_string_ids(self):
+        """Test non-str ID columns raise ValidationError like check_user_id/check_product_id"""
+        for values in ([1, 2], [b'user1', b'user2'], [['a'], ['b']]):
+            for column in ('user_id', 'product_id'):
+                df = pd.DataFrame({
+                    'user_id': ['user1', 'user2'],
+                    'product_id': ['P001', 'P002']
+                })
+                df[column] = pd.Series(values, dtype=object)
+                with self.assertRaisesRegex(ValidationError, r"2 invalid interaction rows, first at: \[0, 1\]"):
+                    validators.validate_interactions_df(df)
+    
+    def test_validate_interactions_df_missing_column(self):
+        """Test missing required column"""
+        with self.assertRaises(ValidationError):
+            validators.validate_interactions_df(pd.DataFrame({'user_id': ['user1']}))
+    
+    def test_validate_interaction_payload_without_msgspec(self):
+        """Test hand-rolled payload checks match the msgspec fast path"""
+        payloads = [
+            {'user_id': 'user123', 'product_id': 'P001', 'rating': 4},
+            {'user_id': 'user123', 'product_id': 'P001', 'rating': '4.5'},
+            {'user_id': 'user123', 'product_id': 'P001', 'interaction_type': 'click'},
+            {'user_id': 'user123', 'product_id': 'P001', 'rating': True}
+        ]
+        
+        def results():
+            out = []
+            for payload in payloads:
+                try:
+                    out.append(validators.validate_interaction_payload(payload))
+                except ValidationError as e:
+                    out.append(str(e))
+            return out
+        
+        expected = results()
+        with mock.patch.object(validators, 'msgspec', None):
+            actual = results()
+        self.assertEqual(actual, expected)
+        # 4 == 4.0, so compare rating types too
+        self.assertEqual(
+            [type(result['rating']) for result in actual if isinstance(result, dict)],
+            [type(result['rating']) for result in expected if isinstance(result, dict)]
+        )
+        self.assertIs(type(expected[0]['rating']), int)
+    
+    def test_validator_class_delegates(self):
+        """Test Validator static methods are the module functions"""
+        self.assertIs(Validator.validate_user_id, validators.validate_user_id)
+        self.assertIs(
+            Validator.validate_interaction_payload,
+            validators.validate_interaction_payload
+        )
 
 
 if __name__ == '__main__':
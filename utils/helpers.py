@@ -1,5 +1,42 @@
-import json
+import logging
 from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import orjson
+from flask import Response
+
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(obj):
+    """Serialize values orjson does not handle natively (Decimal, other NumPy scalars)"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(data):
+    """Encode data as JSON bytes with orjson (NumPy arrays and scalars natively)"""
+    return orjson.dumps(data, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def json_response(data, status=200):
+    """
+    Build a JSON response encoded with orjson
+    
+    Args:
+        data: Response payload, or an already encoded JSON body (bytes)
+        status: HTTP status code
+    
+    Returns:
+        Flask Response with an application/json body
+    """
+    body = data if isinstance(data, bytes) else json_dumps(data)
+    return Response(body, status=status, mimetype='application/json')
 
 
 def format_response(data, status='success', message=None):
@@ -53,11 +90,4 @@ def validate_rating(rating):
 
 def log_api_call(endpoint, method, user_id=None):
     """Log API call for monitoring"""
-    log_entry = {
-        'timestamp': datetime.now().isoformat(),
-        'endpoint': endpoint,
-        'method': method,
-        'user_id': user_id
-    }
-    # In production, send to logging service
-    print(f"API Call: {json.dumps(log_entry)}")
+    logger.info("API call %s %s user_id=%s", method, endpoint, user_id)
@@ -2,19 +2,48 @@
 Logging configuration for E-Commerce Recommendation System
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Queue handler and listener installed by the last setup_logging call
+_queue_handler = None
+_listener = None
+
+
+def _stop_listener():
+    """Detach the queue handler, then flush and close the listener's handlers"""
+    global _queue_handler, _listener
+    
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _queue_handler = None
+    _listener = None
+
+
+# Release the handlers while the interpreter (and gevent hub) is still alive
+atexit.register(_stop_listener)
 
 
 def setup_logging(app):
     """
     Configure logging for the application
     
+    Records are enqueued on the request thread and written by a background
+    QueueListener. Calling this again replaces the previous listener.
+    
     Args:
         app: Flask application instance
     """
+    global _queue_handler, _listener
+    
     # Create logs directory if it doesn't exist
     log_dir = os.path.join(app.config['BASE_DIR'], 'logs')
     os.makedirs(log_dir, exist_ok=True)
@@ -50,15 +79,29 @@ def setup_logging(app):
     console_handler.setLevel(log_level)
     console_handler.setFormatter(detailed_formatter)
     
+    # Handlers run on a background listener thread; loggers only enqueue
+    _stop_listener()
+    
+    log_queue = queue.Queue(-1)
+    _queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(
+        log_queue,
+        file_handler,
+        error_file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    
+    # Configure root logger; the app logger propagates to it
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(_queue_handler)
+    
+    # Numba dumps bytecode at DEBUG while compiling; keep it out of the logs
+    logging.getLogger('numba').setLevel(logging.WARNING)
+    
     # Configure app logger
     app.logger.setLevel(log_level)
-    app.logger.addHandler(file_handler)
-    app.logger.addHandler(error_file_handler)
-    app.logger.addHandler(console_handler)
-    
-    # Configure root logger
-    logging.getLogger().setLevel(log_level)
-    logging.getLogger().addHandler(file_handler)
-    logging.getLogger().addHandler(error_file_handler)
     
-    app.logger.info(f"Logging configured - Level: {logging.getLevelName(log_level)}")
+    app.logger.info("Logging configured - Level: %s", logging.getLevelName(log_level))
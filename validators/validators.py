@@ -4,217 +4,448 @@ Input validation logic separated from business logic
 """
 
 import re
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Final, Literal, Optional
+
+import numpy as np
+import pandas as pd
 from config.constants import (
+    INTERACTION_VIEW,
     VALID_INTERACTION_TYPES,
+    VALID_INTERACTION_TYPES_SET,
     VALID_CATEGORIES,
+    VALID_CATEGORIES_LOWER,
     MIN_RATING,
     MAX_RATING,
     USER_ID_MIN_LENGTH,
     USER_ID_MAX_LENGTH
 )
 
+try:
+    import msgspec
+except ImportError:  # Optional compiled payload validation; fall back to the checks below
+    msgspec = None
+
+
+__all__ = (
+    'ValidationError',
+    'Validator',
+    'check_user_id',
+    'check_product_id',
+    'check_rating',
+    'check_interaction_type',
+    'check_category',
+    'validate_user_id',
+    'validate_product_id',
+    'validate_rating',
+    'validate_limit',
+    'validate_interaction_type',
+    'validate_category',
+    'validate_interaction_payload',
+    'validate_interactions_df'
+)
+
 
 class ValidationError(Exception):
     """Custom validation error"""
     pass
 
 
-class Validator:
-    """Input validation class"""
+# Error messages built from constants, formatted once at import
+_USER_ID_LENGTH_MSG: Final[str] = (
+    f"User ID must be between {USER_ID_MIN_LENGTH} and {USER_ID_MAX_LENGTH} characters"
+)
+_RATING_RANGE_MSG: Final[str] = f"Rating must be between {MIN_RATING} and {MAX_RATING}"
+_INVALID_INTERACTION_TYPE_MSG: Final[str] = (
+    f"Invalid interaction type. Must be one of: {', '.join(VALID_INTERACTION_TYPES)}"
+)
+_INVALID_CATEGORY_MSG: Final[str] = f"Invalid category. Must be one of: {', '.join(VALID_CATEGORIES)}"
+
+
+def check_user_id(user_id: Any) -> Optional[str]:
+    """
+    Check user ID without raising
     
-    @staticmethod
-    def validate_user_id(user_id: str) -> bool:
-        """
-        Validate user ID
+    Args:
+        user_id: User identifier
         
-        Args:
-            user_id: User identifier
-            
-        Returns:
-            True if valid
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        if not user_id or not isinstance(user_id, str):
-            raise ValidationError("User ID must be a non-empty string")
-        
-        if len(user_id) < USER_ID_MIN_LENGTH or len(user_id) > USER_ID_MAX_LENGTH:
-            raise ValidationError(
-                f"User ID must be between {USER_ID_MIN_LENGTH} and {USER_ID_MAX_LENGTH} characters"
-            )
-        
-        return True
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if type(user_id) is not str or not user_id:
+        return "User ID must be a non-empty string"
+    
+    if not USER_ID_MIN_LENGTH <= len(user_id) <= USER_ID_MAX_LENGTH:
+        return _USER_ID_LENGTH_MSG
+    
+    return None
+
+
+def validate_user_id(user_id: str) -> bool:
+    """
+    Validate user ID
     
-    @staticmethod
-    def validate_product_id(product_id: str) -> bool:
-        """
-        Validate product ID
+    Args:
+        user_id: User identifier
         
-        Args:
-            product_id: Product identifier
-            
-        Returns:
-            True if valid
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        if not product_id or not isinstance(product_id, str):
-            raise ValidationError("Product ID must be a non-empty string")
+    Returns:
+        True if valid
         
-        if len(product_id) < 1:
-            raise ValidationError("Product ID cannot be empty")
+    Raises:
+        ValidationError: If validation fails
+    """
+    message = check_user_id(user_id)
+    if message is not None:
+        raise ValidationError(message)
+    return True
+
+
+def check_product_id(product_id: Any) -> Optional[str]:
+    """
+    Check product ID without raising
+    
+    Args:
+        product_id: Product identifier
         
-        return True
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if type(product_id) is not str or not product_id:
+        return "Product ID must be a non-empty string"
     
-    @staticmethod
-    def validate_rating(rating: Optional[float]) -> bool:
-        """
-        Validate rating value
+    return None
+
+
+def validate_product_id(product_id: str) -> bool:
+    """
+    Validate product ID
+    
+    Args:
+        product_id: Product identifier
         
-        Args:
-            rating: Rating value
-            
-        Returns:
-            True if valid
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        if rating is None:
-            return True
+    Returns:
+        True if valid
+        
+    Raises:
+        ValidationError: If validation fails
+    """
+    message = check_product_id(product_id)
+    if message is not None:
+        raise ValidationError(message)
+    return True
+
+
+def check_rating(rating: Any) -> Optional[str]:
+    """
+    Check rating value without raising
+    
+    Args:
+        rating: Rating value
         
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if rating is None:
+        return None
+    
+    # JSON numbers arrive as float/int; only other types need converting
+    rating_type = type(rating)
+    if rating_type is float or rating_type is int:
+        rating_float = rating
+    elif rating_type is bool:
+        return "Rating must be a number"
+    else:
         try:
             rating_float = float(rating)
         except (ValueError, TypeError):
-            raise ValidationError("Rating must be a number")
+            return "Rating must be a number"
+    
+    if not MIN_RATING <= rating_float <= MAX_RATING:
+        return _RATING_RANGE_MSG
+    
+    return None
+
+
+def validate_rating(rating: Optional[float]) -> bool:
+    """
+    Validate rating value
+    
+    Args:
+        rating: Rating value
         
-        if not MIN_RATING <= rating_float <= MAX_RATING:
-            raise ValidationError(f"Rating must be between {MIN_RATING} and {MAX_RATING}")
+    Returns:
+        True if valid
         
-        return True
+    Raises:
+        ValidationError: If validation fails
+    """
+    message = check_rating(rating)
+    if message is not None:
+        raise ValidationError(message)
+    return True
+
+
+def validate_limit(limit: int, max_limit: int = 50) -> int:
+    """
+    Validate and sanitize limit parameter
     
-    @staticmethod
-    def validate_limit(limit: int, max_limit: int = 50) -> int:
-        """
-        Validate and sanitize limit parameter
+    Args:
+        limit: Requested limit
+        max_limit: Maximum allowed limit
         
-        Args:
-            limit: Requested limit
-            max_limit: Maximum allowed limit
-            
-        Returns:
-            Validated limit value
-            
-        Raises:
-            ValidationError: If validation fails
-        """
+    Returns:
+        Validated limit value
+        
+    Raises:
+        ValidationError: If validation fails
+    """
+    # Routes already pass ints; only other types need converting
+    if type(limit) is int:
+        limit_int = limit
+    else:
         try:
             limit_int = int(limit)
         except (ValueError, TypeError):
             raise ValidationError("Limit must be an integer")
+    
+    if limit_int < 1:
+        raise ValidationError("Limit must be at least 1")
+    
+    return limit_int if limit_int <= max_limit else max_limit
+
+
+def check_interaction_type(interaction_type: Any) -> Optional[str]:
+    """
+    Check interaction type without raising
+    
+    Args:
+        interaction_type: Type of interaction
+        
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if not interaction_type or not isinstance(interaction_type, str):
+        return "Interaction type must be a non-empty string"
+    
+    # A frozenset probe beats sys.intern() plus identity checks even for this
+    # small vocabulary, since interning is itself a dict lookup
+    if interaction_type not in VALID_INTERACTION_TYPES_SET:
+        return _INVALID_INTERACTION_TYPE_MSG
+    
+    return None
+
+
+def validate_interaction_type(interaction_type: str) -> bool:
+    """
+    Validate interaction type
+    
+    Args:
+        interaction_type: Type of interaction
         
-        if limit_int < 1:
-            raise ValidationError("Limit must be at least 1")
+    Returns:
+        True if valid
         
-        if limit_int > max_limit:
-            limit_int = max_limit
+    Raises:
+        ValidationError: If validation fails
+    """
+    message = check_interaction_type(interaction_type)
+    if message is not None:
+        raise ValidationError(message)
+    return True
+
+
+@lru_cache(maxsize=256)
+def _category_ok(category: str) -> bool:
+    """Case-insensitive category check, memoized per raw input"""
+    return category.lower() in VALID_CATEGORIES_LOWER
+
+
+def check_category(category: Any) -> Optional[str]:
+    """
+    Check category without raising
+    
+    Args:
+        category: Product category
         
-        return limit_int
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if not category or not isinstance(category, str):
+        return "Category must be a non-empty string"
     
-    @staticmethod
-    def validate_interaction_type(interaction_type: str) -> bool:
-        """
-        Validate interaction type
+    # Case-insensitive validation
+    if not _category_ok(category):
+        return _INVALID_CATEGORY_MSG
+    
+    return None
+
+
+def validate_category(category: str) -> bool:
+    """
+    Validate category
+    
+    Args:
+        category: Product category
         
-        Args:
-            interaction_type: Type of interaction
-            
-        Returns:
-            True if valid
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        if not interaction_type or not isinstance(interaction_type, str):
-            raise ValidationError("Interaction type must be a non-empty string")
-        
-        if interaction_type not in VALID_INTERACTION_TYPES:
-            raise ValidationError(
-                f"Invalid interaction type. Must be one of: {', '.join(VALID_INTERACTION_TYPES)}"
-            )
+    Returns:
+        True if valid
         
-        return True
+    Raises:
+        ValidationError: If validation fails
+    """
+    message = check_category(category)
+    if message is not None:
+        raise ValidationError(message)
+    return True
+
+
+if msgspec is not None:
+    class InteractionPayload(msgspec.Struct):
+        """Interaction payload schema, checked by msgspec in C"""
+        user_id: Annotated[
+            str, msgspec.Meta(min_length=USER_ID_MIN_LENGTH, max_length=USER_ID_MAX_LENGTH)
+        ]
+        product_id: Annotated[str, msgspec.Meta(min_length=1)]
+        interaction_type: Literal[VALID_INTERACTION_TYPES] = INTERACTION_VIEW
+        rating: Optional[Annotated[float, msgspec.Meta(ge=MIN_RATING, le=MAX_RATING)]] = None
+
+
+def validate_interaction_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate interaction payload
     
-    @staticmethod
-    def validate_category(category: str) -> bool:
-        """
-        Validate category
+    Args:
+        data: Request payload
         
-        Args:
-            category: Product category
-            
-        Returns:
-            True if valid
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        if not category or not isinstance(category, str):
-            raise ValidationError("Category must be a non-empty string")
-        
-        # Case-insensitive validation
-        category_lower = category.lower()
-        valid_categories_lower = [cat.lower() for cat in VALID_CATEGORIES]
-        
-        if category_lower not in valid_categories_lower:
-            raise ValidationError(
-                f"Invalid category. Must be one of: {', '.join(VALID_CATEGORIES)}"
-            )
+    Returns:
+        Validated and sanitized data
         
-        return True
+    Raises:
+        ValidationError: If validation fails
+    """
+    if not data:
+        raise ValidationError("Request body is required")
     
-    @staticmethod
-    def validate_interaction_payload(data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Validate interaction payload
-        
-        Args:
-            data: Request payload
-            
-        Returns:
-            Validated and sanitized data
+    if msgspec is not None:
+        # Strict conversion accepts a subset of what the checks below accept;
+        # anything it rejects is re-checked by hand for the exact error message
+        try:
+            payload = msgspec.convert(data, InteractionPayload)
+        except msgspec.ValidationError:
+            pass
+        else:
+            return {
+                'user_id': payload.user_id,
+                'product_id': payload.product_id,
+                'interaction_type': payload.interaction_type,
+                # As given, like the checks below (msgspec coerces ints to float)
+                'rating': data.get('rating')
+            }
+    
+    # Required fields
+    user_id = data.get('user_id')
+    if user_id is None:
+        raise ValidationError("Missing required field: user_id")
+    
+    product_id = data.get('product_id')
+    if product_id is None:
+        raise ValidationError("Missing required field: product_id")
+    
+    # Optional fields with defaults
+    interaction_type = data.get('interaction_type', 'view')
+    rating = data.get('rating')
+    
+    # Validate each field
+    validate_user_id(user_id)
+    validate_product_id(product_id)
+    validate_interaction_type(interaction_type)
+    if rating is not None:
+        validate_rating(rating)
+    
+    return {
+        'user_id': user_id,
+        'product_id': product_id,
+        'interaction_type': interaction_type,
+        'rating': rating
+    }
+
+
+def _string_lengths(values: pd.Series) -> np.ndarray:
+    """Length of each str value as float, NaN for missing or non-str values"""
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+        return np.full(len(values), np.nan)
+    # Same rule as check_user_id/check_product_id: only real str values have a
+    # length; .str.len() would also measure bytes and lists
+    nan = np.nan
+    return np.fromiter(
+        (len(value) if type(value) is str else nan for value in values.to_numpy(dtype=object)),
+        dtype=np.float64,
+        count=len(values)
+    )
+
+
+def validate_interactions_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate a batch of interactions column-wise
+    
+    Applies the same rules as validate_interaction_payload to every row with
+    vectorized checks. interaction_type and rating columns are optional.
+    
+    Args:
+        df: Interactions with user_id, product_id and optionally
+            interaction_type and rating columns
             
-        Raises:
-            ValidationError: If validation fails
-        """
-        if not data:
-            raise ValidationError("Request body is required")
-        
-        # Required fields
-        if 'user_id' not in data:
-            raise ValidationError("Missing required field: user_id")
-        
-        if 'product_id' not in data:
-            raise ValidationError("Missing required field: product_id")
-        
-        # Validate each field
-        Validator.validate_user_id(data['user_id'])
-        Validator.validate_product_id(data['product_id'])
-        
-        # Optional fields with defaults
-        interaction_type = data.get('interaction_type', 'view')
-        Validator.validate_interaction_type(interaction_type)
-        
-        rating = data.get('rating')
-        if rating is not None:
-            Validator.validate_rating(rating)
-        
-        return {
-            'user_id': data['user_id'],
-            'product_id': data['product_id'],
-            'interaction_type': interaction_type,
-            'rating': rating
-        }
+    Returns:
+        The same DataFrame if every row is valid
+        
+    Raises:
+        ValidationError: If a required column is missing or any row is invalid
+    """
+    for column in ('user_id', 'product_id'):
+        if column not in df.columns:
+            raise ValidationError(f"Missing required column: {column}")
+    
+    user_id_lengths = _string_lengths(df['user_id'])
+    invalid = ~(
+        (user_id_lengths >= USER_ID_MIN_LENGTH) & (user_id_lengths <= USER_ID_MAX_LENGTH)
+    )
+    invalid |= ~(_string_lengths(df['product_id']) >= 1)
+    
+    if 'interaction_type' in df.columns:
+        invalid |= ~df['interaction_type'].isin(VALID_INTERACTION_TYPES_SET).to_numpy()
+    
+    if 'rating' in df.columns:
+        ratings = df['rating']
+        missing = ratings.isna().to_numpy()
+        if pd.api.types.is_bool_dtype(ratings):
+            invalid |= ~missing
+        else:
+            values = pd.to_numeric(ratings, errors='coerce').to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            # NaN compares False, so unparseable ratings fail the range check
+            invalid |= ~missing & ~((values >= MIN_RATING) & (values <= MAX_RATING))
+            if ratings.dtype == object:
+                # to_numeric turns True/False into 1.0/0.0; booleans are not ratings
+                invalid |= ratings.map(lambda value: isinstance(value, (bool, np.bool_))).to_numpy()
+    
+    if invalid.any():
+        rows = df.index[invalid]
+        raise ValidationError(
+            f"{len(rows)} invalid interaction rows, first at: {rows[:10].tolist()}"
+        )
+    
+    return df
+
+
+class Validator:
+    """Input validation class, kept for compatibility; use the module functions"""
+    
+    validate_user_id = staticmethod(validate_user_id)
+    validate_product_id = staticmethod(validate_product_id)
+    validate_rating = staticmethod(validate_rating)
+    validate_limit = staticmethod(validate_limit)
+    validate_interaction_type = staticmethod(validate_interaction_type)
+    validate_category = staticmethod(validate_category)
+    validate_interaction_payload = staticmethod(validate_interaction_payload)
+    validate_interactions_df = staticmethod(validate_interactions_df)
@@ -0,0 +1,16 @@
+"""
+WSGI entry point for E-Commerce Recommendation System
+Usage: gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+# Make the standard library cooperative before anything else is imported
+from gevent import monkey
+monkey.patch_all()
+
+from app import create_app  # noqa: E402
+from models.recommendation_engine import get_engine  # noqa: E402
+
+application = create_app('production')
+
+# Build the engine in the master so preloaded workers inherit it on fork
+get_engine()